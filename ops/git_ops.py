@@ -1,11 +1,99 @@
-import os, shutil, time, tempfile, subprocess, json
+import os, re, errno, fnmatch, shutil, time, tempfile, subprocess, json, hashlib, threading, functools
+import base64, http.client, urllib.request
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+try:
+    import orjson  # optional, faster JSON parsing for config files
+except ImportError:
+    orjson = None
 
-def run_cmd(cmd, cwd: Path, env=None):
-    p = subprocess.run(cmd, cwd=str(cwd), env=env, capture_output=True, text=True)
-    return p.returncode, p.stdout, p.stderr
+# parallelism passed to git clone/fetch --jobs
+_FETCH_JOBS = 8
+HTTP_LS_REMOTE_TIMEOUT_SEC = 15
+
+
+def run_cmd(cmd, cwd: Optional[Path], env=None):
+    # bytes + lenient decode: no locale-dependent text decoding of git/papermill output
+    p = subprocess.run(cmd, cwd=(str(cwd) if cwd is not None else None), env=env, capture_output=True)
+    return p.returncode, p.stdout.decode("utf-8", errors="replace"), p.stderr.decode("utf-8", errors="replace")
+
+
+def run_cmd_quiet(cmd, cwd: Optional[Path], env=None) -> int:
+    """For commands whose output is never read: exit code only, streams to devnull."""
+    return subprocess.run(
+        cmd, cwd=(str(cwd) if cwd is not None else None), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    ).returncode
+
+
+def git(args, repo: Path, env=None, quiet: bool = False):
+    """
+    `git -C <repo> <args>`: the repo is passed to git instead of chdir-ing the child,
+    so calls against different repos from worker threads never depend on a cwd.
+    quiet=True -> run_cmd_quiet (exit code only), else run_cmd (code, stdout, stderr).
+    """
+    cmd = ["git", "-C", str(repo), *args]
+    return run_cmd_quiet(cmd, cwd=None, env=env) if quiet else run_cmd(cmd, cwd=None, env=env)
+
+
+class GitSession:
+    """
+    One long-lived `git cat-file --batch-check` per repo.
+    Resolves refs / `<rev>:<path>` to object ids without forking git per lookup.
+    """
+
+    def __init__(self, repo: Path):
+        self.repo = Path(repo)
+        self._proc = subprocess.Popen(
+            ["git", "-C", str(self.repo), "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def resolve(self, ref: str) -> Optional[str]:
+        try:
+            self._proc.stdin.write((ref + "\n").encode("utf-8"))
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline().decode("utf-8", errors="replace")
+        except (OSError, ValueError):
+            return None
+        parts = line.split()
+        if len(parts) != 3:  # "<ref> missing" / "<ref> ambiguous" / dead process
+            return None
+        return parts[0]
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def blob_sha(path: Path) -> str:
+    """Same id `git hash-object` would give, computed in-process."""
+    data = path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def file_matches_head(gs: GitSession, rel_path: str) -> bool:
+    p = gs.repo / rel_path
+    if not p.is_file():
+        return False
+    head = gs.resolve(f"HEAD:{Path(rel_path).as_posix()}")
+    return head is not None and head == blob_sha(p)
+
+
+def _json_loads(text: str):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
 
 
 def read_github_token(orion_home: Path) -> str:
@@ -16,12 +104,23 @@ def read_github_token(orion_home: Path) -> str:
 
     Expected JSON:
       {"token":"..."}  OR  {"github_pat":"..."} OR {"pat":"..."}
+
+    Memoized per ORION_HOME; see clear_token_cache().
     """
-    access_json = (Path(orion_home) / "ops" / "access_token.json").resolve()
+    return _read_github_token_cached(str(Path(orion_home).resolve()))
+
+
+def clear_token_cache():
+    _read_github_token_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _read_github_token_cached(home_str: str) -> str:
+    access_json = (Path(home_str) / "ops" / "access_token.json").resolve()
     if not access_json.exists():
         raise FileNotFoundError(f"Missing GitHub token file: {access_json}")
 
-    data = json.loads(access_json.read_text(encoding="utf-8"))
+    data = _json_loads(access_json.read_text(encoding="utf-8"))
     token = data.get("token") or data.get("github_pat") or data.get("pat")
     if not token or not isinstance(token, str):
         raise RuntimeError(
@@ -39,42 +138,238 @@ def with_token_https(url: str, token: Optional[str]) -> str:
     return url
 
 
-def ls_remote_head_sha(repo_url: str, branch: str, token: Optional[str]) -> str:
-    url = with_token_https(repo_url, token)
-    code, so, se = run_cmd(["git", "ls-remote", url, f"refs/heads/{branch}"], cwd=Path(tempfile.gettempdir()))
-    if code != 0:
-        raise RuntimeError(f"git ls-remote failed: {se.strip() or so.strip()}")
-    if not so.strip():
-        raise RuntimeError("git ls-remote returned empty output")
-    return so.strip().split()[0][:12]
+def is_full_sha(ref: str) -> bool:
+    return re.fullmatch(r"[0-9a-f]{40}", ref) is not None
+
+
+def http_ls_remote_head(repo_url: str, branch: str, token: Optional[str]) -> Optional[str]:
+    """
+    `git ls-remote <url> refs/heads/<branch>` for github.com over the smart-HTTP ref
+    advertisement (pkt-lines), without forking git.
+    Returns the 12-char sha, or None on any failure / non-GitHub URL
+    (caller then falls back to the git subprocess).
+    """
+    url = repo_url.strip()
+    if not url.startswith("https://github.com/"):
+        return None
+    req = urllib.request.Request(
+        url.rstrip("/") + "/info/refs?service=git-upload-pack",
+        headers={"User-Agent": "git/orion"},
+    )
+    if token:
+        # unredirected: urllib copies ordinary headers onto a redirect to any host
+        auth = base64.b64encode(f"{token}:".encode("utf-8")).decode("ascii")
+        req.add_unredirected_header("Authorization", "Basic " + auth)
+    try:
+        with urllib.request.urlopen(req, timeout=HTTP_LS_REMOTE_TIMEOUT_SEC) as resp:
+            data = resp.read()
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+
+    want = f"refs/heads/{branch}".encode("utf-8")
+    pos = 0
+    while pos + 4 <= len(data):
+        try:
+            n = int(data[pos:pos + 4], 16)
+        except ValueError:
+            return None
+        if n == 0:  # flush-pkt
+            pos += 4
+            continue
+        if n < 4:
+            return None
+        line = data[pos + 4:pos + n].split(b"\0", 1)[0].rstrip(b"\n")
+        pos += n
+        sha, _, ref = line.partition(b" ")
+        if ref == want and re.fullmatch(rb"[0-9a-f]{40}", sha):
+            return sha[:12].decode("ascii")
+    return None
+
+
+def _sha_cache_key(repo_url: str, branch: str) -> str:
+    return hashlib.blake2s((repo_url + branch).encode("utf-8")).hexdigest()[:16]
+
+
+def _read_cache(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(path: Path, data: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def ls_remote_head_sha(
+    repo_url: str,
+    branch: str,
+    token: Optional[str],
+    cache_path: Optional[Path] = None,
+    ttl_sec: float = 0,
+) -> str:
+    """
+    Remote branch tip (12 chars): http_ls_remote_head for GitHub, git ls-remote otherwise.
+    With `cache_path` + `ttl_sec`, a sha resolved less than ttl_sec ago is reused.
+    """
+    if is_full_sha(branch):
+        return branch[:12]  # pinned commit: nothing to resolve
+    key = _sha_cache_key(repo_url, branch)
+    if cache_path is not None and ttl_sec > 0:
+        hit = _read_cache(cache_path).get(key)
+        if isinstance(hit, dict) and hit.get("sha") and time.time() - float(hit.get("ts", 0)) < ttl_sec:
+            return hit["sha"]
+    sha = http_ls_remote_head(repo_url, branch, token)
+    if sha is None:
+        url = with_token_https(repo_url, token)
+        code, so, se = run_cmd(["git", "ls-remote", url, f"refs/heads/{branch}"], cwd=Path(tempfile.gettempdir()))
+        if code != 0:
+            raise RuntimeError(f"git ls-remote failed: {se.strip() or so.strip()}")
+        if not so.strip():
+            raise RuntimeError("git ls-remote returned empty output")
+        sha = so.strip().split()[0][:12]
+    if cache_path is not None:
+        _remember_remote_sha(cache_path, repo_url, branch, sha)
+    return sha
+
+
+def _remember_remote_sha(cache_path: Path, repo_url: str, branch: str, sha: str):
+    """Store `sha` as the fresh remote tip of repo_url@branch (no-op for a pinned sha)."""
+    if is_full_sha(branch):
+        return
+    cache = _read_cache(cache_path)
+    cache[_sha_cache_key(repo_url, branch)] = {"sha": sha, "ts": time.time()}
+    _write_cache(cache_path, cache)
+
+
+def _async_rmtree(p: Path):
+    """
+    Rename `p` to a sibling trash dir (cheap, atomic) and delete it on a background
+    thread. The thread is non-daemon, so interpreter exit still waits for it and
+    no trash is left behind; if the rename fails (e.g. open handles on Windows),
+    delete synchronously.
+    """
+    trash = p.with_name(p.name + f".trash.{os.getpid()}.{int(time.time() * 1000)}")
+    try:
+        os.rename(p, trash)
+    except OSError:
+        shutil.rmtree(p, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
 
 
 def clone_depth1(repo_url: str, branch: str, dst: Path, token: Optional[str]):
     url = with_token_https(repo_url, token)
     if dst.exists():
-        shutil.rmtree(dst, ignore_errors=True)
+        _async_rmtree(dst)
+    if is_full_sha(branch):
+        # `clone --branch` only takes names; fetch a pinned commit into a fresh repo
+        dst.mkdir(parents=True)
+        code, so, se = git(["init", "-q"], dst)
+        if code != 0:
+            raise RuntimeError(f"git init failed: {se.strip() or so.strip()}")
+        fetch_reset_depth1(repo_url, branch, dst, token)
+        return
     code, so, se = run_cmd(
-        ["git", "clone", "--depth", "1", "--branch", branch, url, str(dst)],
+        ["git", "-c", "fetch.parallel=0", "clone", "--depth", "1", "--jobs", str(_FETCH_JOBS),
+         "--branch", branch, url, str(dst)],
         cwd=Path(tempfile.gettempdir())
     )
     if code != 0:
         raise RuntimeError(f"git clone failed: {se.strip() or so.strip()}")
 
 
-def update_dir_clone_swap(repo_url: str, branch: str, dst_dir: Path, token: Optional[str]) -> Dict[str, Any]:
-    remote_sha = ls_remote_head_sha(repo_url, branch, token)
+def fetch_reset_depth1(repo_url: str, branch: str, dst: Path, token: Optional[str]):
+    url = with_token_https(repo_url, token)
+    for args in (
+        ["fetch", "--depth", "1", "--jobs", str(_FETCH_JOBS), url, branch],
+        ["reset", "--hard", "FETCH_HEAD"],
+        ["clean", "-fdx", "-e", "__pycache__"],
+    ):
+        code, so, se = git(args, dst)
+        if code != 0:
+            raise RuntimeError(f"git {args[0]} failed: {se.strip() or so.strip()}")
+
+
+def _read_ref_file(git_dir: Path, ref: str) -> Optional[str]:
+    """Resolve `ref` from loose refs, then packed-refs. None if not found."""
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1] == ref:
+            return parts[0]
+    return None
+
+
+def _fast_local_head(dst_dir: Path) -> Optional[str]:
+    """
+    12-char HEAD of a checkout, read straight from .git (HEAD -> loose ref / packed-refs).
+    Spawns git only when the layout is unexpected (e.g. .git is a worktree file).
+    """
+    git_dir = dst_dir / ".git"
+    sha = None
+    if git_dir.is_dir():
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref:"):
+            sha = _read_ref_file(git_dir, head[len("ref:"):].strip())
+        else:
+            sha = head
+    if sha and re.fullmatch(r"[0-9a-f]{40,64}", sha):
+        return sha[:12]
+
+    with GitSession(dst_dir) as gs:
+        head = gs.resolve("HEAD")
+    return head[:12] if head else None
+
+
+def update_dir_clone_swap(
+    repo_url: str,
+    branch: str,
+    dst_dir: Path,
+    token: Optional[str],
+    sha_cache: Optional[Path] = None,
+    sha_ttl_sec: float = 0,
+) -> Dict[str, Any]:
+    remote_sha = ls_remote_head_sha(repo_url, branch, token, cache_path=sha_cache, ttl_sec=sha_ttl_sec)
 
     local_sha = None
     if dst_dir.exists() and (dst_dir / ".git").exists():
-        c, so, _ = run_cmd(["git", "rev-parse", "--short=12", "HEAD"], cwd=dst_dir)
-        if c == 0:
-            local_sha = so.strip()
+        local_sha = _fast_local_head(dst_dir)
 
     if local_sha == remote_sha:
         return {"updated": False, "sha": remote_sha, "error": None, "backup": None}
 
+    if local_sha:
+        try:
+            fetch_reset_depth1(repo_url, branch, dst_dir, token)
+        except RuntimeError:
+            pass  # broken worktree -> fall back to clone+swap
+        else:
+            # the cached tip may be stale: report and cache what was actually fetched
+            fetched_sha = _fast_local_head(dst_dir) or remote_sha
+            if sha_cache is not None:
+                _remember_remote_sha(sha_cache, repo_url, branch, fetched_sha)
+            return {"updated": fetched_sha != local_sha, "sha": fetched_sha, "error": None, "backup": None}
+
     tmp_dir = Path(tempfile.gettempdir()) / f"orion_swap_{dst_dir.name}_{remote_sha}_{int(time.time())}"
     clone_depth1(repo_url, branch, tmp_dir, token)
+    cloned_sha = _fast_local_head(tmp_dir) or remote_sha
+    if sha_cache is not None:
+        _remember_remote_sha(sha_cache, repo_url, branch, cloned_sha)
 
     backup_dir = None
     if dst_dir.exists():
@@ -83,10 +378,10 @@ def update_dir_clone_swap(repo_url: str, branch: str, dst_dir: Path, token: Opti
         while backup_dir.exists():
             i += 1
             backup_dir = dst_dir.parent / f"{dst_dir.name}_backup_{local_sha or int(time.time())}_{i}"
-        shutil.move(str(dst_dir), str(backup_dir))
+        shutil.move(str(dst_dir), str(backup_dir), copy_function=_fast_copy)
 
-    shutil.move(str(tmp_dir), str(dst_dir))
-    return {"updated": True, "sha": remote_sha, "error": None, "backup": str(backup_dir) if backup_dir else None}
+    shutil.move(str(tmp_dir), str(dst_dir), copy_function=_fast_copy)
+    return {"updated": True, "sha": cloned_sha, "error": None, "backup": str(backup_dir) if backup_dir else None}
 
 
 def ensure_repo_checkout(repo_url: str, branch: str, dst_dir: Path, token: Optional[str]) -> Dict[str, Any]:
@@ -98,58 +393,116 @@ def ensure_repo_checkout(repo_url: str, branch: str, dst_dir: Path, token: Optio
     if not (dst_dir / ".git").exists():
         raise RuntimeError(f"Destination exists but not a git repo: {dst_dir}")
 
-    code, so, se = run_cmd(["git", "fetch", "origin", branch], cwd=dst_dir)
-    if code != 0:
-        return {"updated": False, "error": se.strip() or so.strip()}
-
-    code, so, se = run_cmd(["git", "checkout", branch], cwd=dst_dir)
+    code, so, se = git(["fetch", "--depth", "1", "--jobs", str(_FETCH_JOBS), url, branch], dst_dir)
     if code != 0:
         return {"updated": False, "error": se.strip() or so.strip()}
 
-    code, so, se = run_cmd(["git", "pull", "origin", branch], cwd=dst_dir)
+    # point `branch` at the fetched tip and force the worktree to it (no pull/merge)
+    code, so, se = git(["checkout", "-q", "-f", "-B", branch, "FETCH_HEAD"], dst_dir)
     if code != 0:
         return {"updated": False, "error": se.strip() or so.strip()}
 
     return {"updated": True, "error": None}
 
 
+def _fast_copy(src, dst):
+    """
+    copy2 replacement: in-kernel os.copy_file_range where available (Linux),
+    1 MiB buffered copy otherwise / when the kernel refuses (e.g. cross-FS on old kernels).
+    """
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            while os.copy_file_range(s.fileno(), d.fileno(), 1 << 30):
+                pass
+        except (AttributeError, OSError):
+            shutil.copyfileobj(s, d, 1 << 20)  # continues from the current offsets
+    shutil.copystat(src, dst)
+    return dst
+
+
+# os.link failures that just mean "links not possible here" (other volume, FS without links)
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        _fast_copy(src, dst)
+
+
+def _iter_files(root: Path, suffix: Optional[str] = None, ignore=()):
+    """
+    Walk `root` with os.scandir (cached dirent types, no per-entry Path/stat).
+    Yields (DirEntry, rel_path) for files; entries whose basename matches an
+    `ignore` glob are skipped (directories are not descended into).
+    """
+    stack = [(str(root), "")]
+    while stack:
+        top, rel_top = stack.pop()
+        with os.scandir(top) as it:
+            for entry in it:
+                if ignore and any(fnmatch.fnmatch(entry.name, pat) for pat in ignore):
+                    continue
+                rel = os.path.join(rel_top, entry.name) if rel_top else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                elif entry.is_file():  # symlinked files still count
+                    if suffix is None or entry.name.endswith(suffix):
+                        yield entry, rel
+
+
 def copy_tree(src: Path, dst: Path):
+    """
+    Mirror src files into dst. Files are hardlinked (copied only across volumes),
+    so dst must be treated as read-only while src is alive.
+    """
     dst.mkdir(parents=True, exist_ok=True)
-    for item in src.rglob("*"):
-        rel = item.relative_to(src)
+    made = {""}
+    for entry, rel in _iter_files(src):
+        parent = os.path.dirname(rel)
+        if parent not in made:
+            (dst / parent).mkdir(parents=True, exist_ok=True)
+            made.add(parent)
         out = dst / rel
-        if item.is_dir():
-            out.mkdir(parents=True, exist_ok=True)
-        else:
-            out.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, out)
+        try:
+            _link_or_copy(entry.path, out)
+        except FileExistsError:
+            out.unlink()
+            _link_or_copy(entry.path, out)
 
 
 def git_add_commit_push(repo_dir: Path, message: str, add_paths: list[str], branch: str = "main") -> Dict[str, Any]:
     out = {"pushed": False, "commit": None, "error": None}
-    for p in add_paths:
-        run_cmd(["git", "add", p], cwd=repo_dir)
+    with GitSession(repo_dir) as gs:
+        # plain files identical to HEAD need neither `git add` nor a commit
+        changed = [p for p in add_paths if not file_matches_head(gs, p)]
+        if not changed:
+            return out
+
+        for p in changed:
+            git(["add", p], repo_dir, quiet=True)
 
-    code, _, _ = run_cmd(["git", "diff", "--cached", "--quiet"], cwd=repo_dir)
-    if code == 0:
-        return out
+        code = git(["diff", "--cached", "--quiet"], repo_dir, quiet=True)
+        if code == 0:
+            return out
 
-    run_cmd(["git", "config", "user.name", "orion-bot"], cwd=repo_dir)
-    run_cmd(["git", "config", "user.email", "orion-bot@local"], cwd=repo_dir)
+        git(["config", "user.name", "orion-bot"], repo_dir, quiet=True)
+        git(["config", "user.email", "orion-bot@local"], repo_dir, quiet=True)
 
-    c, so, se = run_cmd(["git", "commit", "-m", message], cwd=repo_dir)
-    if c != 0:
-        out["error"] = (se.strip() or so.strip() or "commit failed")
-        return out
+        c, so, se = git(["commit", "-m", message], repo_dir)
+        if c != 0:
+            out["error"] = (se.strip() or so.strip() or "commit failed")
+            return out
 
-    c2, so2, _ = run_cmd(["git", "rev-parse", "HEAD"], cwd=repo_dir)
-    if c2 == 0:
-        out["commit"] = so2.strip() or None
+        out["commit"] = gs.resolve("HEAD")
 
-    c3, so3, se3 = run_cmd(["git", "push", "origin", branch], cwd=repo_dir)
-    if c3 != 0:
-        out["error"] = (se3.strip() or so3.strip() or "push failed")
-        return out
+        c3, so3, se3 = git(["push", "origin", branch], repo_dir)
+        if c3 != 0:
+            out["error"] = (se3.strip() or so3.strip() or "push failed")
+            return out
 
     out["pushed"] = True
     return out
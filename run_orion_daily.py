@@ -1,21 +1,49 @@
 import os
+import re
 import sys
+import errno
+import hashlib
+import fnmatch
+import string
 import json
 import time
 import shutil
 import subprocess
 import platform
 import tempfile
+import argparse
+import threading
+import functools
+import base64
+import http.client
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone
-from shutil import copytree, rmtree, ignore_patterns
+from shutil import rmtree
 from typing import Optional, Dict, Any
 
+try:
+    import orjson  # optional, faster JSON parsing for config files
+except ImportError:
+    orjson = None
+
 
 CRACEN_NOTEBOOK = "CRACEN.ipynb"
 STRATEGIES_DIRNAME = "STRATEGIES"
 SIGNALS_DIRNAME = "signals"
 STATUS_DIRNAME = "status"
+REMOTE_SHA_CACHE_FILENAME = "remote_sha_cache.json"
+HTTP_LS_REMOTE_TIMEOUT_SEC = 15
+# internal files under status/ that are never published to the results repo
+RESULTS_IGNORE = ("*.tmp", "*.lock", REMOTE_SHA_CACHE_FILENAME)
+
+# parallelism passed to git clone/fetch --jobs (ops/config.json fetch_jobs, set in main)
+_FETCH_JOBS = 8
+
+# partial clone (--filter) + cone sparse checkout; `git add/rm --sparse` need git 2.34
+PARTIAL_CLONE_MIN_GIT = (2, 34)
+_GIT_VERSION: Optional[tuple] = None
 
 
 def utc_now_iso():
@@ -32,14 +60,33 @@ def find_orion_home() -> Path:
     return Path(__file__).resolve().parent
 
 
-def run_cmd(cmd, cwd: Path, env=None):
-    p = subprocess.run(cmd, cwd=str(cwd), env=env, capture_output=True, text=True)
-    return p.returncode, p.stdout, p.stderr
+def run_cmd(cmd, cwd: Optional[Path], env=None):
+    # bytes + lenient decode: no locale-dependent text decoding of git/papermill output
+    p = subprocess.run(cmd, cwd=(str(cwd) if cwd is not None else None), env=env, capture_output=True)
+    return p.returncode, p.stdout.decode("utf-8", errors="replace"), p.stderr.decode("utf-8", errors="replace")
+
+
+def run_cmd_quiet(cmd, cwd: Optional[Path], env=None) -> int:
+    """For commands whose output is never read: exit code only, streams to devnull."""
+    return subprocess.run(
+        cmd, cwd=(str(cwd) if cwd is not None else None), env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    ).returncode
+
+
+def git(args, repo: Path, env=None, quiet: bool = False):
+    """
+    `git -C <repo> <args>`: the repo is passed to git instead of chdir-ing the child,
+    so calls against different repos from worker threads never depend on a cwd.
+    quiet=True -> run_cmd_quiet (exit code only), else run_cmd (code, stdout, stderr).
+    """
+    cmd = ["git", "-C", str(repo), *args]
+    return run_cmd_quiet(cmd, cwd=None, env=env) if quiet else run_cmd(cmd, cwd=None, env=env)
 
 
 def run_notebook(nb_path: Path, cwd: Path, env: dict):
     if shutil.which("papermill") is None:
-        code, _, _ = run_cmd([sys.executable, "-m", "papermill", "-h"], cwd=cwd, env=env)
+        code = run_cmd_quiet([sys.executable, "-m", "papermill", "-h"], cwd=cwd, env=env)
         if code != 0:
             return 2, "", "papermill not installed. Install: pip install papermill"
 
@@ -50,58 +97,114 @@ def run_notebook(nb_path: Path, cwd: Path, env: dict):
     return run_cmd(cmd, cwd=cwd, env=env)
 
 
-def write_status(orion_home: Path, status: dict):
-    st_dir = orion_home / STATUS_DIRNAME
-    st_dir.mkdir(parents=True, exist_ok=True)
-    (st_dir / "latest.json").write_text(json.dumps(status, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-
-    md = []
-    md.append("# OriON Daily Status\n")
-    md.append(f"- Updated (UTC): **{status.get('updated_at_utc')}**")
-    md.append(f"- Host: **{status.get('host')}**\n")
-
-    md.append("## GitHub")
-    gh = status.get("github", {})
-    md.append(f"- strategies repo: `{gh.get('strategies_repo')}`")
-    if gh.get("strategies_sha"): md.append(f"- strategies sha: `{gh.get('strategies_sha')}`")
-    if gh.get("strategies_updated") is not None: md.append(f"- strategies updated: **{gh.get('strategies_updated')}**")
-    if gh.get("strategies_error"): md.append(f"- strategies error: `{gh.get('strategies_error')}`")
-    md.append(f"- results repo: `{gh.get('results_repo')}`")
-    if gh.get("results_commit"): md.append(f"- results commit: `{gh.get('results_commit')}`")
-    if gh.get("results_pushed") is not None: md.append(f"- results pushed: **{gh.get('results_pushed')}**")
-    if gh.get("results_error"): md.append(f"- results error: `{gh.get('results_error')}`")
-    if gh.get("results_layout"): md.append(f"- results layout: `{gh.get('results_layout')}`")
-    if gh.get("results_subdir") is not None: md.append(f"- results subdir: `{gh.get('results_subdir')}`")
-    md.append("")
-
-    md.append("## Datum API")
-    da = status.get("datum_api", {})
-    md.append(f"- ok: **{da.get('ok')}**")
-    if da.get("config_path"): md.append(f"- config: `{da.get('config_path')}`")
-    if da.get("credentials_path"): md.append(f"- credentials: `{da.get('credentials_path')}`")
-    if da.get("staged_config_path"): md.append(f"- staged config: `{da.get('staged_config_path')}`")
-    if da.get("staged_credentials_path"): md.append(f"- staged credentials: `{da.get('staged_credentials_path')}`")
-    if da.get("error"): md.append(f"- error: `{da.get('error')}`")
-    md.append("")
-
-    md.append("## CRACEN")
-    cr = status.get("cracen", {})
-    md.append(f"- ok: **{cr.get('ok')}**")
-    if cr.get("error"): md.append(f"- error: `{cr.get('error')}`")
-    md.append(f"- final: `{cr.get('final_path')}`\n")
-
-    md.append("## Strategies")
-    for k, v in (status.get("strategies") or {}).items():
-        ok = "✅" if v.get("ok") else "❌"
-        extra = f" ({int(v.get('duration_sec', 0))}s)" if v.get("duration_sec") else ""
-        if v.get("error"): extra += f" — {v['error']}"
-        md.append(f"- {ok} **{k}**{extra}")
-
-    if status.get("fatal_error"):
-        md.append("\n## Fatal")
-        md.append(f"- `{status.get('fatal_error')}`")
-
-    (st_dir / "latest.md").write_text("\n".join(md) + "\n", encoding="utf-8")
+def run_strategy(nb_path: Path, cwd: Path, env: dict) -> Dict[str, Any]:
+    t_s = time.time()
+    code, so, se = run_notebook(nb_path, cwd=cwd, env=env)
+    info = {"ok": (code == 0), "duration_sec": time.time() - t_s}
+    if code != 0:
+        info["error"] = (se.strip() or so.strip() or f"exit {code}")[:2000]
+    return info
+
+
+def default_strategy_workers() -> int:
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+_STATUS_TEMPLATE = string.Template(
+    "# OriON Daily Status\n\n"
+    "- Updated (UTC): **${updated}**\n"
+    "- Host: **${host}**\n\n"
+    "## GitHub\n${github}\n\n"
+    "## Datum API\n${datum_api}\n\n"
+    "## CRACEN\n${cracen}\n\n"
+    "## Strategies${strategies}${fatal}\n"
+)
+
+# (label, key, style, show): style "b" = **bold** / "c" = `code`;
+# show "always" | "set" (truthy) | "known" (not None)
+_GITHUB_FIELDS = (
+    ("strategies repo", "strategies_repo", "c", "always"),
+    ("strategies sha", "strategies_sha", "c", "set"),
+    ("strategies updated", "strategies_updated", "b", "known"),
+    ("strategies error", "strategies_error", "c", "set"),
+    ("results repo", "results_repo", "c", "always"),
+    ("results commit", "results_commit", "c", "set"),
+    ("results pushed", "results_pushed", "b", "known"),
+    ("results error", "results_error", "c", "set"),
+    ("results layout", "results_layout", "c", "set"),
+    ("results subdir", "results_subdir", "c", "known"),
+)
+_DATUM_FIELDS = (
+    ("ok", "ok", "b", "always"),
+    ("config", "config_path", "c", "set"),
+    ("credentials", "credentials_path", "c", "set"),
+    ("staged config", "staged_config_path", "c", "set"),
+    ("staged credentials", "staged_credentials_path", "c", "set"),
+    ("error", "error", "c", "set"),
+)
+_CRACEN_FIELDS = (
+    ("ok", "ok", "b", "always"),
+    ("error", "error", "c", "set"),
+    ("final", "final_path", "c", "always"),
+)
+
+
+def _md_fields(d: dict, fields) -> str:
+    return "\n".join(
+        f"- {label}: " + (f"**{v}**" if style == "b" else f"`{v}`")
+        for label, key, style, show in fields
+        for v in (d.get(key),)
+        if show == "always" or (show == "set" and v) or (show == "known" and v is not None)
+    )
+
+
+def _strategy_md(name: str, v: dict) -> str:
+    tick = "✅" if v.get("ok") else "❌"
+    extra = f" ({int(v.get('duration_sec', 0))}s)" if v.get("duration_sec") else ""
+    if v.get("error"): extra += f" — {v['error']}"
+    return f"\n- {tick} **{name}**{extra}"
+
+
+def render_status_md(status: dict) -> str:
+    return _STATUS_TEMPLATE.substitute(
+        updated=status.get("updated_at_utc"),
+        host=status.get("host"),
+        github=_md_fields(status.get("github", {}), _GITHUB_FIELDS),
+        datum_api=_md_fields(status.get("datum_api", {}), _DATUM_FIELDS),
+        cracen=_md_fields(status.get("cracen", {}), _CRACEN_FIELDS),
+        strategies="".join(_strategy_md(k, v) for k, v in (status.get("strategies") or {}).items()),
+        fatal=(f"\n\n## Fatal\n- `{status['fatal_error']}`" if status.get("fatal_error") else ""),
+    )
+
+
+class StatusWriter:
+    """
+    Owns status/latest.json + latest.md for one run.
+    `status` is mutated freely by the caller; nothing touches disk until flush(),
+    and flush() skips any file whose rendered body is identical to the last one written.
+    """
+
+    def __init__(self, orion_home: Path, status: dict):
+        self.st_dir = orion_home / STATUS_DIRNAME
+        self.status = status
+        self._digests: Dict[str, bytes] = {}
+
+    def flush(self):
+        self.st_dir.mkdir(parents=True, exist_ok=True)
+        for name, body in (
+            ("latest.json", json.dumps(self.status, indent=2, ensure_ascii=False) + "\n"),
+            ("latest.md", render_status_md(self.status)),
+        ):
+            digest = hashlib.blake2s(body.encode("utf-8")).digest()
+            path = self.st_dir / name
+            if self._digests.get(name) == digest and path.exists():
+                continue
+            path.write_text(body, encoding="utf-8")
+            self._digests[name] = digest
+
+
+def _json_loads(text: str):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
 
 
 # ---------------------------
@@ -112,11 +215,17 @@ def read_github_token(orion_home: Path) -> str:
     HARD RULE:
       Read GitHub PAT ONLY from OriON/ops/access_token.json
     Never read OriON/access_token.json (Datum).
+    Memoized per ORION_HOME; see clear_config_caches().
     """
-    p = (orion_home / "ops" / "access_token.json").resolve()
+    return _read_github_token_cached(str(Path(orion_home).resolve()))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_github_token_cached(home_str: str) -> str:
+    p = (Path(home_str) / "ops" / "access_token.json").resolve()
     if not p.exists():
         raise FileNotFoundError(f"Missing GitHub token file: {p}")
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = _json_loads(p.read_text(encoding="utf-8"))
     token = data.get("token") or data.get("github_pat") or data.get("pat")
     if not token or not isinstance(token, str):
         raise RuntimeError(f"GitHub token not found in {p}. Expected key: token/github_pat/pat")
@@ -151,55 +260,268 @@ def with_token_https(repo_url_https: str, token: str) -> str:
     return url
 
 
-def ls_remote_head_sha(repo_url: str, branch: str, token: str) -> str:
-    tmp_base = Path(tempfile.gettempdir())
-    url = with_token_https(repo_url, token)
-    code, so, se = run_cmd(["git", "ls-remote", url, f"refs/heads/{branch}"], cwd=tmp_base)
-    if code != 0:
-        raise RuntimeError(f"git ls-remote failed: {se.strip() or so.strip()}")
-    if not so.strip():
-        raise RuntimeError("git ls-remote returned empty output")
-    return so.strip().split()[0][:12]
+def is_full_sha(ref: str) -> bool:
+    return re.fullmatch(r"[0-9a-f]{40}", ref) is not None
+
+
+def http_ls_remote_head(repo_url: str, branch: str, token: Optional[str]) -> Optional[str]:
+    """
+    `git ls-remote <url> refs/heads/<branch>` for github.com over the smart-HTTP ref
+    advertisement (pkt-lines), without forking git.
+    Returns the 12-char sha, or None on any failure / non-GitHub URL
+    (caller then falls back to the git subprocess).
+    """
+    url = normalize_repo_url_to_https(repo_url)
+    if not url.startswith("https://github.com/"):
+        return None
+    req = urllib.request.Request(
+        url.rstrip("/") + "/info/refs?service=git-upload-pack",
+        headers={"User-Agent": "git/orion"},
+    )
+    if token:
+        # unredirected: urllib copies ordinary headers onto a redirect to any host
+        auth = base64.b64encode(f"{token}:".encode("utf-8")).decode("ascii")
+        req.add_unredirected_header("Authorization", "Basic " + auth)
+    try:
+        with urllib.request.urlopen(req, timeout=HTTP_LS_REMOTE_TIMEOUT_SEC) as resp:
+            data = resp.read()
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+
+    want = f"refs/heads/{branch}".encode("utf-8")
+    pos = 0
+    while pos + 4 <= len(data):
+        try:
+            n = int(data[pos:pos + 4], 16)
+        except ValueError:
+            return None
+        if n == 0:  # flush-pkt
+            pos += 4
+            continue
+        if n < 4:
+            return None
+        line = data[pos + 4:pos + n].split(b"\0", 1)[0].rstrip(b"\n")
+        pos += n
+        sha, _, ref = line.partition(b" ")
+        if ref == want and re.fullmatch(rb"[0-9a-f]{40}", sha):
+            return sha[:12].decode("ascii")
+    return None
+
+
+def _sha_cache_key(repo_url: str, branch: str) -> str:
+    return hashlib.blake2s((repo_url + branch).encode("utf-8")).hexdigest()[:16]
+
+
+def _read_cache(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(path: Path, data: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def ls_remote_head_sha(
+    repo_url: str,
+    branch: str,
+    token: str,
+    cache_path: Optional[Path] = None,
+    ttl_sec: float = 0,
+) -> str:
+    """
+    Remote branch tip (12 chars): http_ls_remote_head for GitHub, git ls-remote otherwise.
+    With `cache_path` + `ttl_sec`, a sha resolved less than ttl_sec ago is reused.
+    """
+    if is_full_sha(branch):
+        return branch[:12]  # pinned commit: nothing to resolve
+    key = _sha_cache_key(repo_url, branch)
+    if cache_path is not None and ttl_sec > 0:
+        hit = _read_cache(cache_path).get(key)
+        if isinstance(hit, dict) and hit.get("sha") and time.time() - float(hit.get("ts", 0)) < ttl_sec:
+            return hit["sha"]
+    sha = http_ls_remote_head(repo_url, branch, token)
+    if sha is None:
+        tmp_base = Path(tempfile.gettempdir())
+        url = with_token_https(repo_url, token)
+        code, so, se = run_cmd(["git", "ls-remote", url, f"refs/heads/{branch}"], cwd=tmp_base)
+        if code != 0:
+            raise RuntimeError(f"git ls-remote failed: {se.strip() or so.strip()}")
+        if not so.strip():
+            raise RuntimeError("git ls-remote returned empty output")
+        sha = so.strip().split()[0][:12]
+    if cache_path is not None:
+        _remember_remote_sha(cache_path, repo_url, branch, sha)
+    return sha
+
+
+def _remember_remote_sha(cache_path: Path, repo_url: str, branch: str, sha: str):
+    """Store `sha` as the fresh remote tip of repo_url@branch (no-op for a pinned sha)."""
+    if is_full_sha(branch):
+        return
+    cache = _read_cache(cache_path)
+    cache[_sha_cache_key(repo_url, branch)] = {"sha": sha, "ts": time.time()}
+    _write_cache(cache_path, cache)
+
+
+def _async_rmtree(p: Path):
+    """
+    Rename `p` to a sibling trash dir (cheap, atomic) and delete it on a background
+    thread. The thread is non-daemon, so interpreter exit still waits for it and
+    no trash is left behind; if the rename fails (e.g. open handles on Windows),
+    delete synchronously.
+    """
+    trash = p.with_name(p.name + f".trash.{os.getpid()}.{int(time.time() * 1000)}")
+    try:
+        os.rename(p, trash)
+    except OSError:
+        shutil.rmtree(p, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
 
 
 def clone_depth1(repo_url: str, branch: str, dst: Path, token: str):
     url = with_token_https(repo_url, token)
     if dst.exists():
-        shutil.rmtree(dst, ignore_errors=True)
+        _async_rmtree(dst)
+    if is_full_sha(branch):
+        # `clone --branch` only takes names; fetch a pinned commit into a fresh repo
+        dst.mkdir(parents=True)
+        code, so, se = git(["init", "-q"], dst)
+        if code != 0:
+            raise RuntimeError(f"git init failed: {se.strip() or so.strip()}")
+        fetch_reset_depth1(repo_url, branch, dst, token)
+        return
     code, so, se = run_cmd(
-        ["git", "clone", "--depth", "1", "--branch", branch, url, str(dst)],
+        ["git", "-c", "fetch.parallel=0", "clone", "--depth", "1", "--jobs", str(_FETCH_JOBS),
+         "--branch", branch, url, str(dst)],
         cwd=Path(tempfile.gettempdir())
     )
     if code != 0:
         raise RuntimeError(f"git clone failed: {se.strip() or so.strip()}")
 
 
-def update_strategies_clone_swap(repo_url: str, branch: str, dst_dir: Path, token: str) -> Dict[str, Any]:
+def fetch_reset_depth1(repo_url: str, branch: str, dst: Path, token: str):
+    """
+    Bring an existing checkout to the remote branch tip in place:
+    shallow fetch of the delta + hard reset + clean of untracked files.
+    """
+    url = with_token_https(repo_url, token)
+    for args in (
+        ["fetch", "--depth", "1", "--jobs", str(_FETCH_JOBS), url, branch],
+        ["reset", "--hard", "FETCH_HEAD"],
+        ["clean", "-fdx", "-e", "__pycache__"],
+    ):
+        code, so, se = git(args, dst)
+        if code != 0:
+            raise RuntimeError(f"git {args[0]} failed: {se.strip() or so.strip()}")
+
+
+def _read_ref_file(git_dir: Path, ref: str) -> Optional[str]:
+    """Resolve `ref` from loose refs, then packed-refs. None if not found."""
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1] == ref:
+            return parts[0]
+    return None
+
+
+def _fast_local_head(dst_dir: Path) -> Optional[str]:
     """
-    Clone+swap STRATEGIES atomically.
+    12-char HEAD of a checkout, read straight from .git (HEAD -> loose ref / packed-refs).
+    Spawns git only when the layout is unexpected (e.g. .git is a worktree file).
+    """
+    git_dir = dst_dir / ".git"
+    sha = None
+    if git_dir.is_dir():
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            head = ""
+        if head.startswith("ref:"):
+            sha = _read_ref_file(git_dir, head[len("ref:"):].strip())
+        else:
+            sha = head
+    if sha and re.fullmatch(r"[0-9a-f]{40,64}", sha):
+        return sha[:12]
+
+    c, so, _ = git(["rev-parse", "--short=12", "HEAD"], dst_dir)
+    return so.strip() if c == 0 and so.strip() else None
+
+
+def update_strategies_clone_swap(
+    repo_url: str,
+    branch: str,
+    dst_dir: Path,
+    token: str,
+    remote_cache: Optional[Path] = None,
+    remote_ttl_sec: float = 0,
+) -> Dict[str, Any]:
+    """
+    Update STRATEGIES to the remote branch tip (or to a pinned 40-hex sha passed as `branch`).
+    Existing checkout: fetch --depth 1 + reset in place (rolled back if no notebooks).
+    Missing/corrupt checkout: clone+swap atomically.
+    The remote tip is reused from `remote_cache` for `remote_ttl_sec` seconds; after
+    a fetch/clone, "sha" is the commit actually checked out and the cache is refreshed.
+    A pinned sha already checked out returns without spawning git
+    (no ls-remote for a pinned sha, local HEAD read from .git).
     Returns {"updated":bool,"sha":str|None,"error":str|None,"backup":str|None}
     """
     out = {"updated": False, "sha": None, "error": None, "backup": None}
 
-    remote_sha = ls_remote_head_sha(repo_url, branch, token)
+    remote_sha = ls_remote_head_sha(repo_url, branch, token, cache_path=remote_cache, ttl_sec=remote_ttl_sec)
     out["sha"] = remote_sha
 
     local_sha = None
     if dst_dir.exists() and (dst_dir / ".git").exists():
-        c, so, _ = run_cmd(["git", "rev-parse", "--short=12", "HEAD"], cwd=dst_dir)
-        if c == 0:
-            local_sha = so.strip()
+        local_sha = _fast_local_head(dst_dir)
 
     if local_sha and local_sha == remote_sha:
         return out  # no update
 
+    if local_sha:
+        try:
+            fetch_reset_depth1(repo_url, branch, dst_dir, token)
+        except RuntimeError:
+            pass  # broken worktree -> fall back to clone+swap
+        else:
+            # the cached tip may be stale: report and cache what was actually fetched
+            fetched_sha = _fast_local_head(dst_dir) or remote_sha
+            if remote_cache is not None:
+                _remember_remote_sha(remote_cache, repo_url, branch, fetched_sha)
+            # sanity: must have at least one .ipynb somewhere
+            if not _has_file(dst_dir, ".ipynb"):
+                git(["reset", "--hard", local_sha], dst_dir, quiet=True)
+                out["sha"] = local_sha
+                out["error"] = "No notebooks found in strategies repo"
+                return out
+            out["sha"] = fetched_sha
+            out["updated"] = fetched_sha != local_sha
+            return out
+
     tmp_dir = Path(tempfile.gettempdir()) / f"orion_strategies_{remote_sha}_{int(time.time())}"
     clone_depth1(repo_url, branch, tmp_dir, token)
+    cloned_sha = _fast_local_head(tmp_dir) or remote_sha
+    if remote_cache is not None:
+        _remember_remote_sha(remote_cache, repo_url, branch, cloned_sha)
 
     # sanity: must have at least one .ipynb somewhere
-    found_ipynb = list(tmp_dir.rglob("*.ipynb"))
-    if not found_ipynb:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+    if not _has_file(tmp_dir, ".ipynb"):
+        _async_rmtree(tmp_dir)
+        out["sha"] = local_sha
         out["error"] = "No notebooks found in strategies repo"
         return out
 
@@ -210,14 +532,133 @@ def update_strategies_clone_swap(repo_url: str, branch: str, dst_dir: Path, toke
         while backup_dir.exists():
             i += 1
             backup_dir = dst_dir.parent / f"{dst_dir.name}_backup_{local_sha or int(time.time())}_{i}"
-        shutil.move(str(dst_dir), str(backup_dir))
+        shutil.move(str(dst_dir), str(backup_dir), copy_function=_fast_copy)
 
-    shutil.move(str(tmp_dir), str(dst_dir))
+    shutil.move(str(tmp_dir), str(dst_dir), copy_function=_fast_copy)
+    out["sha"] = cloned_sha
     out["updated"] = True
     out["backup"] = str(backup_dir) if backup_dir else None
     return out
 
 
+def _fast_copy(src, dst):
+    """
+    copy2 replacement: in-kernel os.copy_file_range where available (Linux),
+    1 MiB buffered copy otherwise / when the kernel refuses (e.g. cross-FS on old kernels).
+    """
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            while os.copy_file_range(s.fileno(), d.fileno(), 1 << 30):
+                pass
+        except (AttributeError, OSError):
+            shutil.copyfileobj(s, d, 1 << 20)  # continues from the current offsets
+    shutil.copystat(src, dst)
+    return dst
+
+
+# os.link failures that just mean "links not possible here" (other volume, FS without links)
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        _fast_copy(src, dst)
+
+
+def _iter_files(root: Path, suffix: Optional[str] = None, ignore=()):
+    """
+    Walk `root` with os.scandir (cached dirent types, no per-entry Path/stat).
+    Yields (DirEntry, rel_path) for files; entries whose basename matches an
+    `ignore` glob are skipped (directories are not descended into).
+    """
+    stack = [(str(root), "")]
+    while stack:
+        top, rel_top = stack.pop()
+        with os.scandir(top) as it:
+            for entry in it:
+                if ignore and any(fnmatch.fnmatch(entry.name, pat) for pat in ignore):
+                    continue
+                rel = os.path.join(rel_top, entry.name) if rel_top else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                elif entry.is_file():  # symlinked files still count
+                    if suffix is None or entry.name.endswith(suffix):
+                        yield entry, rel
+
+
+def _has_file(root: Path, suffix: str) -> bool:
+    """True on the first `suffix` file under root (.git is not searched)."""
+    return next(_iter_files(root, suffix=suffix, ignore=(".git",)), None) is not None
+
+
+def _has_any_ipynb(root: Path) -> bool:
+    return root.is_dir() and _has_file(root, ".ipynb")
+
+
+def _has_entries(p: Path) -> bool:
+    """Non-empty directory, decided from the first scandir entry."""
+    if not p.is_dir():
+        return False
+    with os.scandir(p) as it:
+        return next(it, None) is not None
+
+
+def link_tree(src: Path, dst: Path, ignore=()):
+    """
+    Mirror src into dst with hardlinks (copies across volumes),
+    skipping any entry whose basename matches one of the `ignore` globs.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    made = {""}
+    for entry, rel in _iter_files(src, ignore=ignore):
+        parent = os.path.dirname(rel)
+        if parent not in made:
+            (dst / parent).mkdir(parents=True, exist_ok=True)
+            made.add(parent)
+        out = dst / rel
+        try:
+            _link_or_copy(entry.path, out)
+        except FileExistsError:
+            out.unlink()
+            _link_or_copy(entry.path, out)
+
+
+def git_version() -> tuple:
+    """(major, minor) of the git on PATH, (0, 0) if unknown. Probed once per process."""
+    global _GIT_VERSION
+    if _GIT_VERSION is None:
+        code, so, _ = run_cmd(["git", "version"], cwd=Path(tempfile.gettempdir()))
+        m = re.search(r"(\d+)\.(\d+)", so) if code == 0 else None
+        _GIT_VERSION = (int(m.group(1)), int(m.group(2))) if m else (0, 0)
+    return _GIT_VERSION
+
+
+def clone_results_repo(results_repo_url: str, branch: str, token: str) -> Path:
+    """
+    Shallow-clone the results repo into a fresh temp dir and return it.
+    With a recent git the clone is blobless and sparse (cone mode): only root-level
+    files such as .gitignore/.gitattributes are checked out, since signals/ and
+    status/ get overwritten anyway and every other path is committed unchanged.
+    """
+    tmp_base = Path(tempfile.gettempdir())
+    tmp_dir = tmp_base / f"orion_stats_{int(time.time())}"
+    url = with_token_https(results_repo_url, token)
+    partial = git_version() >= PARTIAL_CLONE_MIN_GIT
+    cmd = ["git", "-c", "fetch.parallel=0", "clone", "--depth", "1", "--jobs", str(_FETCH_JOBS)]
+    if partial:
+        cmd += ["--filter=blob:none", "--sparse"]
+    cmd += ["--branch", branch, url, str(tmp_dir)]
+    c, so, se = run_cmd(cmd, cwd=tmp_base)
+    if c != 0:
+        rmtree(str(tmp_dir), ignore_errors=True)
+        raise RuntimeError(f"git clone failed: {se.strip() or so.strip()}")
+    return tmp_dir
+
+
 def push_results_to_repo(
     results_repo_url: str,
     branch: str,
@@ -226,9 +667,11 @@ def push_results_to_repo(
     *,
     results_layout: str = "root",
     results_subdir: str = "",
+    repo_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """
-    Clone results repo into temp, overwrite signals/ and status/ into:
+    Clone results repo into temp (or take an already cloned `repo_dir`, which is
+    consumed), overwrite signals/ and status/ into:
       - layout=root: repo_root/(signals,status)
       - layout=subdir OR results_subdir provided: repo_root/<subdir>/(signals,status)
     Then commit & push.
@@ -236,25 +679,25 @@ def push_results_to_repo(
     out = {"pushed": False, "commit": None, "error": None}
 
     ts = utc_now_iso()
-    tmp_base = Path(tempfile.gettempdir())
-    tmp_dir = tmp_base / f"orion_stats_{int(time.time())}"
+    tmp_dir = repo_dir
 
     subdir = (results_subdir or "").strip().strip("/").strip("\\")
     use_subdir = (results_layout.lower() == "subdir") or bool(subdir)
 
     try:
-        url = with_token_https(results_repo_url, token)
-        c, so, se = run_cmd(["git", "clone", "--depth", "1", "--branch", branch, url, str(tmp_dir)], cwd=tmp_base)
-        if c != 0:
-            out["error"] = f"git clone failed: {se.strip() or so.strip()}"
-            return out
-
         src_signals = orion_home / SIGNALS_DIRNAME
         src_status = orion_home / STATUS_DIRNAME
-        if not src_signals.exists() and not src_status.exists():
+        if not _has_entries(src_signals) and not _has_entries(src_status):
             out["error"] = "No signals/ or status/ to push"
             return out
 
+        if tmp_dir is None:
+            try:
+                tmp_dir = clone_results_repo(results_repo_url, branch, token)
+            except RuntimeError as ex:
+                out["error"] = str(ex)
+                return out
+
         base = tmp_dir / subdir if use_subdir else tmp_dir
         base.mkdir(parents=True, exist_ok=True)
 
@@ -267,34 +710,44 @@ def push_results_to_repo(
             rmtree(str(dest_status), ignore_errors=True)
 
         if src_signals.exists():
-            copytree(str(src_signals), str(dest_signals), dirs_exist_ok=True, ignore=ignore_patterns("*.tmp", "*.lock"))
+            link_tree(src_signals, dest_signals, ignore=RESULTS_IGNORE)
         if src_status.exists():
-            copytree(str(src_status), str(dest_status), dirs_exist_ok=True, ignore=ignore_patterns("*.tmp", "*.lock"))
+            link_tree(src_status, dest_status, ignore=RESULTS_IGNORE)
 
         add_signals = str(Path(subdir) / SIGNALS_DIRNAME) if use_subdir else SIGNALS_DIRNAME
         add_status = str(Path(subdir) / STATUS_DIRNAME) if use_subdir else STATUS_DIRNAME
 
-        run_cmd(["git", "add", add_signals], cwd=tmp_dir)
-        run_cmd(["git", "add", add_status], cwd=tmp_dir)
+        if git_version() >= PARTIAL_CLONE_MIN_GIT:
+            # sparse clone: signals/ and status/ sit outside the cone (skip-worktree),
+            # so drop their old index entries and re-add what is on disk now
+            git(["rm", "-r", "-q", "--cached", "--sparse", "--ignore-unmatch", "--", add_signals, add_status],
+                tmp_dir, quiet=True)
+            git(["add", "--sparse", "--", add_signals, add_status], tmp_dir, quiet=True)
+        else:
+            git(["add", add_signals], tmp_dir, quiet=True)
+            git(["add", add_status], tmp_dir, quiet=True)
 
-        code, _, _ = run_cmd(["git", "diff", "--cached", "--quiet"], cwd=tmp_dir)
+        code = git(["diff", "--cached", "--quiet"], tmp_dir, quiet=True)
         if code == 0:
             return out  # nothing to commit
 
-        run_cmd(["git", "config", "user.name", "orion-bot"], cwd=tmp_dir)
-        run_cmd(["git", "config", "user.email", "orion-bot@local"], cwd=tmp_dir)
+        git(["config", "user.name", "orion-bot"], tmp_dir, quiet=True)
+        git(["config", "user.email", "orion-bot@local"], tmp_dir, quiet=True)
 
         cm = f"orion: update signals/status {ts}"
-        c2, so2, se2 = run_cmd(["git", "commit", "-m", cm], cwd=tmp_dir)
+        # -q: no diffstat, which would lazily fetch the old blobs of a partial clone
+        c2, so2, se2 = git(["commit", "-q", "-m", cm], tmp_dir)
         if c2 != 0:
             out["error"] = f"git commit failed: {se2.strip() or so2.strip()}"
             return out
 
-        c3, so3, _ = run_cmd(["git", "rev-parse", "HEAD"], cwd=tmp_dir)
+        c3, so3, _ = git(["rev-parse", "HEAD"], tmp_dir)
         if c3 == 0:
             out["commit"] = so3.strip() or None
 
-        c4, so4, se4 = run_cmd(["git", "push", "origin", branch], cwd=tmp_dir)
+        # thin packs would lazily fetch old blobs of a partial clone as delta bases
+        push_args = ["push", "--no-thin"] if git_version() >= PARTIAL_CLONE_MIN_GIT else ["push"]
+        c4, so4, se4 = git([*push_args, "origin", branch], tmp_dir)
         if c4 != 0:
             out["error"] = f"git push failed: {se4.strip() or so4.strip()}"
             return out
@@ -304,7 +757,8 @@ def push_results_to_repo(
 
     finally:
         try:
-            rmtree(str(tmp_dir), ignore_errors=True)
+            if tmp_dir is not None:
+                _async_rmtree(tmp_dir)
         except Exception:
             pass
 
@@ -343,8 +797,8 @@ def stage_datum_secrets(repo_root: Path, orion_home: Path):
 
     dst_cfg = orion_home / "datum_api_config.json"
     dst_creds = orion_home / "datum_api_credentials.json"
-    shutil.copy2(src_cfg, dst_cfg)
-    shutil.copy2(src_creds, dst_creds)
+    _fast_copy(src_cfg, dst_cfg)
+    _fast_copy(src_creds, dst_creds)
     return dst_cfg, dst_creds
 
 
@@ -359,22 +813,75 @@ def cleanup_datum_secrets(orion_home: Path):
 
 
 def load_ops_config(orion_home: Path) -> Dict[str, Any]:
-    cfg_path = (orion_home / "ops" / "config.json").resolve()
+    """Memoized per ORION_HOME (callers get their own shallow copy); see clear_config_caches()."""
+    return dict(_load_ops_config_cached(str(Path(orion_home).resolve())))
+
+
+def clear_config_caches():
+    _load_ops_config_cached.cache_clear()
+    _read_github_token_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_ops_config_cached(home_str: str) -> Dict[str, Any]:
+    cfg_path = (Path(home_str) / "ops" / "config.json").resolve()
     if not cfg_path.exists():
         raise FileNotFoundError(f"Missing ops config: {cfg_path}")
-    cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+    cfg = _json_loads(cfg_path.read_text(encoding="utf-8"))
 
     cfg.setdefault("strategies_repo", "https://github.com/bohdan6992/OriON-strategies.git")
     cfg.setdefault("strategies_branch", "main")
+    cfg.setdefault("strategies_pinned_sha", "")  # 40-hex sha overrides strategies_branch
     cfg.setdefault("results_repo", "https://github.com/bohdan6992/OriON-stats.git")
     cfg.setdefault("results_branch", "main")
     cfg.setdefault("results_layout", "root")     # root | subdir
     cfg.setdefault("results_subdir", "")
     cfg.setdefault("use_clone_swap", True)
+    cfg.setdefault("strategy_workers", 0)        # 0 = auto (cpu_count // 2)
+    cfg.setdefault("fetch_jobs", 8)
+    cfg.setdefault("strategies_sha_ttl_sec", 300)  # reuse last ls-remote result; 0 = always ask
+    cfg.setdefault("min_run_interval_sec", 0)      # skip if the last run is younger; 0 = off
+    cfg.setdefault("unchanged_rerun_sec", 0)       # skip if strategies sha unchanged and last run ok + younger; 0 = off
     return cfg
 
 
-def main():
+def read_last_status(orion_home: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads((orion_home / STATUS_DIRNAME / "latest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def status_age_sec(status: dict) -> Optional[float]:
+    """Seconds since status["updated_at_utc"] (utc_now_iso format), None if absent/invalid."""
+    ts = status.get("updated_at_utc")
+    if not ts:
+        return None
+    try:
+        dt = datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+    return time.time() - dt.timestamp()
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="OriON daily runner")
+    ap.add_argument(
+        "--jobs", type=int, default=None,
+        help="strategy notebooks to run in parallel (overrides ops/config.json strategy_workers)",
+    )
+    ap.add_argument(
+        "--once-every", type=float, default=None, metavar="SEC",
+        help="exit 0 without doing anything if the last run finished < SEC ago "
+             "(overrides ops/config.json min_run_interval_sec)",
+    )
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    global _FETCH_JOBS
+    args = parse_args(argv)
     t0 = time.time()
     host = platform.node()
 
@@ -420,17 +927,30 @@ def main():
         "durations_sec": {},
         "fatal_error": None,
     }
+    status_writer = StatusWriter(orion_home, status)
 
     staged = None
+    results_clone = None  # Future[Path] of the background results-repo clone
     try:
         # --------------------------
         # 0) Read ops config + GitHub token (ONLY from ops)
         # --------------------------
         ops_cfg = load_ops_config(orion_home)
+
+        # watch-loop guard: bail out before any git/papermill process is spawned
+        last_status = read_last_status(orion_home)
+        last_age = status_age_sec(last_status)
+        min_interval = args.once_every if args.once_every is not None else float(ops_cfg.get("min_run_interval_sec") or 0)
+        if min_interval > 0 and last_age is not None and last_age < min_interval:
+            print(f"OriON: last run {int(last_age)}s ago (< {int(min_interval)}s), skipping")
+            return 0
+
         token = read_github_token(orion_home)
+        _FETCH_JOBS = max(1, int(ops_cfg.get("fetch_jobs") or 8))
 
         strategies_repo = ops_cfg.get("strategies_repo")
         strategies_branch = ops_cfg.get("strategies_branch", "main")
+        strategies_pinned_sha = (ops_cfg.get("strategies_pinned_sha") or "").strip().lower()
         results_repo = ops_cfg.get("results_repo")
         results_branch = ops_cfg.get("results_branch", "main")
         results_layout = ops_cfg.get("results_layout", "root")
@@ -449,9 +969,11 @@ def main():
             try:
                 upd = update_strategies_clone_swap(
                     repo_url=strategies_repo,
-                    branch=strategies_branch,
+                    branch=(strategies_pinned_sha or strategies_branch),
                     dst_dir=(orion_home / STRATEGIES_DIRNAME),
                     token=token,
+                    remote_cache=(orion_home / STATUS_DIRNAME / REMOTE_SHA_CACHE_FILENAME),
+                    remote_ttl_sec=float(ops_cfg.get("strategies_sha_ttl_sec") or 0),
                 )
                 status["github"]["strategies_sha"] = upd.get("sha")
                 status["github"]["strategies_updated"] = bool(upd.get("updated"))
@@ -462,6 +984,31 @@ def main():
         else:
             status["github"]["strategies_updated"] = False
 
+        unchanged_sec = float(ops_cfg.get("unchanged_rerun_sec") or 0)
+        last_gh = last_status.get("github") or {}
+        if (
+            unchanged_sec > 0
+            and last_age is not None and last_age < unchanged_sec
+            and not status["github"]["strategies_updated"]
+            and status["github"]["strategies_sha"]
+            and status["github"]["strategies_sha"] == last_gh.get("strategies_sha")
+            and (last_status.get("cracen") or {}).get("ok")
+            and not last_gh.get("results_error")
+            and not last_status.get("fatal_error")
+            # the checkpoint flush after CRACEN also has cracen.ok; only a run that got to the push counts
+            and last_gh.get("results_pushed") is not None
+        ):
+            print(f"OriON: strategies unchanged at {status['github']['strategies_sha']}, last run ok, skipping")
+            return 0
+
+        # nothing to run (e.g. after a failed clone-swap): stop before papermill starts
+        if not _has_any_ipynb(orion_home / STRATEGIES_DIRNAME):
+            status["updated_at_utc"] = utc_now_iso()
+            status["cracen"]["ok"] = False
+            status["cracen"]["error"] = "no notebooks present"
+            status_writer.flush()
+            return 1
+
         # --------------------------
         # 2) Resolve + stage Datum API secrets into OriON cwd
         # --------------------------
@@ -494,7 +1041,7 @@ def main():
             status["updated_at_utc"] = utc_now_iso()
             status["cracen"]["ok"] = False
             status["cracen"]["error"] = f"Missing: {cracen_nb}"
-            write_status(orion_home, status)
+            status_writer.flush()
             return 1
 
         t_cr = time.time()
@@ -505,43 +1052,62 @@ def main():
             status["updated_at_utc"] = utc_now_iso()
             status["cracen"]["ok"] = False
             status["cracen"]["error"] = (se.strip() or so.strip() or f"exit {code}")[:2000]
-            write_status(orion_home, status)
+            status_writer.flush()
             return 1
 
         if not final_path.exists():
             status["updated_at_utc"] = utc_now_iso()
             status["cracen"]["ok"] = False
             status["cracen"]["error"] = f"CRACEN finished but missing final.parquet: {final_path}"
-            write_status(orion_home, status)
+            status_writer.flush()
             return 1
 
         status["cracen"]["ok"] = True
+        # checkpoint: a crash during strategies still leaves a meaningful status
+        status["updated_at_utc"] = utc_now_iso()
+        status_writer.flush()
 
         # --------------------------
         # 4) run strategies (all notebooks except CRACEN)
+        #    results repo is cloned in the background meanwhile (network vs CPU)
         # --------------------------
+        clone_pool = ThreadPoolExecutor(max_workers=1)
+        results_clone = clone_pool.submit(clone_results_repo, results_repo, results_branch, token)
+        clone_pool.shutdown(wait=False)
+
+        # Notebooks are independent papermill subprocesses with disjoint
+        # status/last_<stem>_out.ipynb outputs, so a thread pool is enough.
         strat_dir = (orion_home / STRATEGIES_DIRNAME)
-        for nb in sorted(strat_dir.glob("*.ipynb")):
-            if nb.name == CRACEN_NOTEBOOK:
-                continue
-            name = nb.stem
-            t_s = time.time()
-            code, so, se = run_notebook(nb, cwd=orion_home, env=env)
-            info = {"ok": (code == 0), "duration_sec": time.time() - t_s}
-            if code != 0:
-                info["error"] = (se.strip() or so.strip() or f"exit {code}")[:2000]
-            status["strategies"][name] = info
+        with os.scandir(strat_dir) as it:
+            nbs = sorted(
+                Path(e.path) for e in it
+                if e.name.endswith(".ipynb") and e.name != CRACEN_NOTEBOOK and e.is_file()
+            )
+        workers = args.jobs or int(ops_cfg.get("strategy_workers") or 0) or default_strategy_workers()
+        results = {}
+        if nbs:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(nbs)))) as ex:
+                futs = {ex.submit(run_strategy, nb, orion_home, env): nb for nb in nbs}
+                for f in as_completed(futs):
+                    results[futs[f].stem] = f.result()
+        for nb in nbs:
+            status["strategies"][nb.stem] = results[nb.stem]
 
         # --------------------------
-        # 5) write status
+        # 5) write status (before the push: status/ is part of what gets pushed)
         # --------------------------
         status["updated_at_utc"] = utc_now_iso()
         status["durations_sec"]["total"] = time.time() - t0
-        write_status(orion_home, status)
+        status_writer.flush()
 
         # --------------------------
         # 6) push results to OriON-stats (signals + status)
         # --------------------------
+        try:
+            pre_cloned = results_clone.result()
+        except Exception:
+            pre_cloned = None  # push_results_to_repo retries the clone and reports its error
+        results_clone = None
         res_push = push_results_to_repo(
             results_repo_url=results_repo,
             branch=results_branch,
@@ -549,11 +1115,12 @@ def main():
             orion_home=orion_home,
             results_layout=results_layout,
             results_subdir=results_subdir,
+            repo_dir=pre_cloned,
         )
         status["github"]["results_pushed"] = bool(res_push.get("pushed"))
         status["github"]["results_commit"] = res_push.get("commit")
         status["github"]["results_error"] = res_push.get("error")
-        write_status(orion_home, status)
+        status_writer.flush()
 
         if not status["cracen"]["ok"]:
             return 1
@@ -564,12 +1131,18 @@ def main():
     except Exception as e:
         status["updated_at_utc"] = utc_now_iso()
         status["fatal_error"] = str(e)[:2000]
-        write_status(orion_home, status)
+        status_writer.flush()
         return 1
 
     finally:
         if staged is not None:
             cleanup_datum_secrets(orion_home)
+        if results_clone is not None:
+            # run aborted before the push consumed the background clone
+            try:
+                _async_rmtree(results_clone.result())
+            except Exception:
+                pass
 
 
 if __name__ == "__main__":